@@ -1,19 +1,53 @@
 """Configuration module for Team AI Impact Dashboard."""
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
+# Environment variables read by the dashboard, with their defaults
+_ENV_DEFAULTS = {
+    "JIRA_URL": None,
+    "JIRA_USER": None,
+    "JIRA_TOKEN": None,
+    "JIRA_PROJECT_KEY": "PROJ",
+    "GOOGLE_CREDENTIALS_JSON": None,
+    "GOOGLE_SHEET_URL": None,
+    "GOOGLE_API_KEY": None,
+    "ADMIN_EMAIL": "admin@example.com",
+    "JIRA_CACHE_DIR": os.path.join("~", ".cache", "team_dashboard"),
+}
+
+# Set once .env has been parsed; inherited by child processes and survives module reloads
+_ENV_LOADED_FLAG = "_DASHBOARD_ENV_LOADED"
+
+
+@lru_cache(maxsize=1)
+def _load_environment() -> dict:
+    """Load the .env file (at most once per process) and snapshot the dashboard variables.
+    
+    Returns:
+        Dictionary of environment variable name to value (or its default)
+    """
+    if not os.environ.get(_ENV_LOADED_FLAG):
+        load_dotenv()
+        os.environ[_ENV_LOADED_FLAG] = "1"
+    return {key: os.environ.get(key, default) for key, default in _ENV_DEFAULTS.items()}
+
+
 # Load Environment Variables
-load_dotenv()
+_env = _load_environment()
 
 # Jira Configuration
-JIRA_URL = os.getenv("JIRA_URL")
-JIRA_USER = os.getenv("JIRA_USER")
-JIRA_TOKEN = os.getenv("JIRA_TOKEN")
-JIRA_PROJECT_KEY = os.getenv("JIRA_PROJECT_KEY", "PROJ")
+JIRA_URL = _env["JIRA_URL"]
+JIRA_USER = _env["JIRA_USER"]
+JIRA_TOKEN = _env["JIRA_TOKEN"]
+JIRA_PROJECT_KEY = _env["JIRA_PROJECT_KEY"]
+JIRA_CACHE_DIR = _env["JIRA_CACHE_DIR"]  # Set to an empty value to disable the issue cache
 
 # Google Sheets Configuration
-GOOGLE_CREDENTIALS_JSON = os.getenv("GOOGLE_CREDENTIALS_JSON")
-GOOGLE_SHEET_URL = os.getenv("GOOGLE_SHEET_URL")
+GOOGLE_CREDENTIALS_JSON = _env["GOOGLE_CREDENTIALS_JSON"]
+GOOGLE_SHEET_URL = _env["GOOGLE_SHEET_URL"]
+GOOGLE_API_KEY = _env["GOOGLE_API_KEY"]
+ADMIN_EMAIL = _env["ADMIN_EMAIL"]
 SHEET_NAME = "Team AI Impact Index"
 
 # Jira Custom Field IDs
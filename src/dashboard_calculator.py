@@ -1,7 +1,7 @@
 """Dashboard calculator module for aggregating metrics and calculating scores."""
 import logging
-import datetime
 import re
+import numpy as np
 import pandas as pd
 from config import (
     COMPLETION_STATUSES,
@@ -22,6 +22,21 @@ from config import (
 
 logger = logging.getLogger(__name__)
 
+# Sprint names look like 'Iteration MM.DD.YY - MM.DD.YY'; the first date is the start date
+_SPRINT_DATE_RE = re.compile(r'Iteration (\d{2}\.\d{2}\.\d{2})')
+
+# Compact dtypes for the per-sprint aggregation: categoricals let the groupby
+# and mask building work on integer codes instead of hashing strings, and the
+# integer counters fit in int32. Fractional cycle times and story points stay
+# float64 so the rounded per-ticket averages are unchanged.
+_AGGREGATION_DTYPES = {
+    'Rejection Count': 'int32',
+    'Reached Delivered': 'int32',
+    'Sprint Name': 'category',
+    'Issue Type': 'category',
+    'Status': 'category'
+}
+
 
 def calculate_scores(metrics_df: pd.DataFrame, flow_df: pd.DataFrame) -> pd.DataFrame:
     """Aggregate metrics by Sprint and calculate the Dashboard Index.
@@ -33,101 +48,114 @@ def calculate_scores(metrics_df: pd.DataFrame, flow_df: pd.DataFrame) -> pd.Data
     Returns:
         DataFrame with aggregated dashboard scores
     """
-    # Parse dates first
-    metrics_df['Sprint Start Date'] = metrics_df['Sprint Name'].apply(_parse_sprint_date)
+    # Parse dates first (once per unique sprint name, reused for the dashboard below)
+    sprint_date_map = _parse_sprint_dates(metrics_df['Sprint Name'])
+    # Map from plain values: mapping a categorical would return a Categorical of dates
+    metrics_df['Sprint Start Date'] = metrics_df['Sprint Name'].astype(object).map(sprint_date_map)
     metrics_df['Created Date Parsed'] = pd.to_datetime(metrics_df['Created Date'], errors='coerce')
     
-    # Keep unfiltered copy for bug counting (we want all bugs created by date, regardless of sprint assignment)
-    unfiltered_metrics_df = metrics_df.copy()
+    # Down-cast aggregation columns (returns a new frame, so the caller's data is untouched)
+    metrics_df = metrics_df.astype(_AGGREGATION_DTYPES)
+    
+    # Resolve the issue type codes once; both the bug and the non-task masks compare codes
+    issue_type_categories = metrics_df['Issue Type'].cat.categories
+    bug_codes = np.flatnonzero(issue_type_categories == 'Bug')
+    task_codes = np.flatnonzero(issue_type_categories == 'Task')
+    
+    # Extract bug creation dates before filtering (we want all bugs created by date, regardless of sprint assignment)
+    bug_mask = np.isin(metrics_df['Issue Type'].cat.codes.to_numpy(), bug_codes)
+    bug_dates = metrics_df.loc[bug_mask, 'Created Date Parsed'].dropna()
+    bug_dates = np.sort(bug_dates.to_numpy(dtype='datetime64[ns]'))
     
     # Exclude active sprint (determine the most recent sprint by date)
+    most_recent_sprint_date = None
     if not metrics_df.empty:
         most_recent_sprint_date = metrics_df['Sprint Start Date'].max()
         # Filter out the most recent sprint (active sprint) for sprint-based metrics
-        metrics_df = metrics_df[metrics_df['Sprint Start Date'] < most_recent_sprint_date].copy()
+        # Sprints without a parseable date are never the active sprint, so they are kept
+        metrics_df = metrics_df[
+            (metrics_df['Sprint Start Date'] < most_recent_sprint_date) |
+            metrics_df['Sprint Start Date'].isna()
+        ]
         logger.info(f"Excluded active sprint with start date: {most_recent_sprint_date}")
     
-    # Filter for completed tickets
-    done_mask = metrics_df['Status'].str.lower().isin(COMPLETION_STATUSES)
-    
-    # Count completed tickets (all types)
-    ticket_counts = metrics_df[done_mask].groupby('Sprint Name').size().reset_index(name='Completed Tickets')
-    
-    # Track story points
-    sprint_velocity = metrics_df[done_mask].groupby('Sprint Name')['Story Points'].sum().reset_index()
-    sprint_velocity.rename(columns={'Story Points': 'Total Story Points'}, inplace=True)
-
-    # Total Cycle Time for completed items
-    cycle_time_sum = metrics_df[done_mask].groupby('Sprint Name')['Days In Progress'].sum().reset_index()
-    dev_cycle_sum = metrics_df[done_mask].groupby('Sprint Name')['Dev Cycle Time'].sum().reset_index()
-    review_cycle_sum = metrics_df[done_mask].groupby('Sprint Name')['Review Cycle Time'].sum().reset_index()
-    acceptance_cycle_sum = metrics_df[done_mask].groupby('Sprint Name')['Acceptance Cycle Time'].sum().reset_index()
-    
-    # Total Delivered Count (exclude Tasks - they are automatically accepted)
-    non_task_mask = metrics_df['Issue Type'] != 'Task'
-    delivered_count = metrics_df[non_task_mask].groupby('Sprint Name')['Reached Delivered'].sum().reset_index()
-    
-    # Rejection Count (Sum, exclude Tasks)
-    rejection_sum = metrics_df[non_task_mask].groupby('Sprint Name')['Rejection Count'].sum().reset_index()
+    # Filter for completed tickets (lowercase the distinct statuses once, then match on category codes)
+    statuses = metrics_df['Status']
+    completed_codes = np.flatnonzero(statuses.cat.categories.str.lower().isin(COMPLETION_STATUSES))
+    done_mask = np.isin(statuses.cat.codes.to_numpy(), completed_codes)
+    
+    # Aggregate completed tickets (all types) in a single grouping pass:
+    # ticket count, story points and total cycle times
+    done_aggregates = metrics_df[done_mask].groupby('Sprint Name', observed=True).agg(**{
+        'Completed Tickets': ('Status', 'size'),
+        'Total Story Points': ('Story Points', 'sum'),
+        'Days In Progress': ('Days In Progress', 'sum'),
+        'Dev Cycle Time': ('Dev Cycle Time', 'sum'),
+        'Review Cycle Time': ('Review Cycle Time', 'sum'),
+        'Acceptance Cycle Time': ('Acceptance Cycle Time', 'sum')
+    })
+    
+    # Total Delivered Count and Rejection Count (exclude Tasks - they are automatically accepted)
+    non_task_mask = ~np.isin(metrics_df['Issue Type'].cat.codes.to_numpy(), task_codes)
+    non_task_aggregates = metrics_df[non_task_mask].groupby('Sprint Name', observed=True).agg(**{
+        'Reached Delivered': ('Reached Delivered', 'sum'),
+        'Rejection Count': ('Rejection Count', 'sum')
+    })
     
     # Count bugs created during each sprint period
     # For each sprint, count bugs where created date falls within that sprint's week
-    # Use unfiltered data so we count ALL bugs created by date, regardless of sprint assignment
-    bugs_created_per_sprint = _count_bugs_created_in_sprint_periods(unfiltered_metrics_df)
+    # Use unfiltered bugs and sprints so we count ALL bugs created by date, regardless of sprint assignment
+    bugs_created_per_sprint = _count_bugs_created_in_sprint_periods(bug_dates, sprint_date_map)
 
-    # Merge Aggregates
-    dashboard = ticket_counts.merge(sprint_velocity, on='Sprint Name', how='outer')
-    dashboard = dashboard.merge(cycle_time_sum, on='Sprint Name', how='outer')
-    dashboard = dashboard.merge(dev_cycle_sum, on='Sprint Name', how='outer')
-    dashboard = dashboard.merge(review_cycle_sum, on='Sprint Name', how='outer')
-    dashboard = dashboard.merge(acceptance_cycle_sum, on='Sprint Name', how='outer')
-    dashboard = dashboard.merge(delivered_count, on='Sprint Name', how='outer')
-    dashboard = dashboard.merge(rejection_sum, on='Sprint Name', how='outer')
-    dashboard = dashboard.merge(bugs_created_per_sprint, on='Sprint Name', how='outer')
+    # Merge Aggregates (all three are indexed by Sprint Name, so align on the index)
+    dashboard = pd.concat(
+        [done_aggregates, non_task_aggregates, bugs_created_per_sprint.set_index('Sprint Name')],
+        axis=1, join='outer', sort=True
+    ).rename_axis('Sprint Name').reset_index()
     
     # Fill NaNs
     dashboard.fillna(0, inplace=True)
     
     # --- SCORING LOGIC ---
     
-    # Avg Cycle Time per Ticket (all types)
-    dashboard['Avg Cycle Time per Ticket'] = dashboard.apply(
-        lambda row: row['Days In Progress'] / row['Completed Tickets'] if row['Completed Tickets'] > 0 else 0, axis=1
-    ).round(2)
-    
-    # Break out cycle time per ticket metrics
-    dashboard['Avg Dev Cycle Time per Ticket'] = dashboard.apply(
-        lambda row: row['Dev Cycle Time'] / row['Completed Tickets'] if row['Completed Tickets'] > 0 else 0, axis=1
-    ).round(2)
-    
-    dashboard['Avg Review Cycle Time per Ticket'] = dashboard.apply(
-        lambda row: row['Review Cycle Time'] / row['Completed Tickets'] if row['Completed Tickets'] > 0 else 0, axis=1
-    ).round(2)
-    
-    dashboard['Avg Acceptance Cycle Time per Ticket'] = dashboard.apply(
-        lambda row: row['Acceptance Cycle Time'] / row['Completed Tickets'] if row['Completed Tickets'] > 0 else 0, axis=1
-    ).round(2)
+    # Avg Cycle Time per Ticket (all types), broken out into dev/review/acceptance
+    # All four averages share the ticket count denominator, so divide the block at once
+    cycle_time_cols = ['Days In Progress', 'Dev Cycle Time', 'Review Cycle Time', 'Acceptance Cycle Time']
+    avg_cycle_time_cols = [
+        'Avg Cycle Time per Ticket',
+        'Avg Dev Cycle Time per Ticket',
+        'Avg Review Cycle Time per Ticket',
+        'Avg Acceptance Cycle Time per Ticket'
+    ]
+    cycle_time_totals = dashboard[cycle_time_cols].to_numpy(dtype=float)
+    ticket_counts = dashboard['Completed Tickets'].to_numpy(dtype=float)[:, None]
+    avg_cycle_times = np.divide(
+        cycle_time_totals, ticket_counts,
+        out=np.zeros_like(cycle_time_totals), where=ticket_counts > 0
+    )
+    dashboard[avg_cycle_time_cols] = avg_cycle_times.round(2)
     
     # Cycle time per point for reference
-    dashboard['Avg Cycle Time per Point (Total)'] = dashboard.apply(
-        lambda row: row['Days In Progress'] / row['Total Story Points'] if row['Total Story Points'] > 0 else 0, axis=1
-    ).round(2)
+    total_points = dashboard['Total Story Points'].where(dashboard['Total Story Points'] > 0)
+    dashboard['Avg Cycle Time per Point (Total)'] = (
+        dashboard['Days In Progress'] / total_points
+    ).fillna(0).round(2)
 
     # Rejection Ratio %
-    dashboard['Rejection Ratio %'] = dashboard.apply(
-        lambda row: (row['Rejection Count'] / row['Reached Delivered'] * 100) if row['Reached Delivered'] > 0 else 0, axis=1
-    )
-    dashboard['Rejection Ratio %'] = dashboard['Rejection Ratio %'].round(1)
+    reached_delivered = dashboard['Reached Delivered'].where(dashboard['Reached Delivered'] > 0)
+    dashboard['Rejection Ratio %'] = (
+        dashboard['Rejection Count'] / reached_delivered * 100
+    ).fillna(0).round(1)
     
     # Bug Score (penalty per bug, capped at max bugs)
-    dashboard['Bug Score'] = dashboard['Bugs Created'].apply(
-        lambda bugs: max(0, EXCELLENCE_SCORE - (min(bugs, BUG_PENALTY_CAP) * BUG_PENALTY_PER_BUG))
-    ).round(1)
+    dashboard['Bug Score'] = (
+        EXCELLENCE_SCORE - dashboard['Bugs Created'].clip(upper=BUG_PENALTY_CAP) * BUG_PENALTY_PER_BUG
+    ).clip(lower=0).round(1)
     
     # Rejection Score (inverse of rejection ratio)
-    dashboard['Rejection Score'] = dashboard['Rejection Ratio %'].apply(
-        lambda r: max(0, EXCELLENCE_SCORE - r)
-    ).round(1)
+    dashboard['Rejection Score'] = (
+        EXCELLENCE_SCORE - dashboard['Rejection Ratio %']
+    ).clip(lower=0).round(1)
 
     # Merge Flow Scores from survey data
     dashboard = dashboard.merge(flow_df, left_on='Sprint Name', right_on='sprint_name', how='left')
@@ -149,34 +177,40 @@ def calculate_scores(metrics_df: pd.DataFrame, flow_df: pd.DataFrame) -> pd.Data
     
     # Velocity Score (60% weight) - Composite of Efficiency + Throughput
     # Calculate historical medians (excluding zero values)
-    median_tickets = dashboard[dashboard['Completed Tickets'] > 0]['Completed Tickets'].median()
-    median_cycle_time = dashboard[dashboard['Avg Cycle Time per Ticket'] > 0]['Avg Cycle Time per Ticket'].median()
+    tickets = dashboard['Completed Tickets'].to_numpy(dtype=float)
+    cycle_times = dashboard['Avg Cycle Time per Ticket'].to_numpy(dtype=float)
+    positive_tickets = tickets[tickets > 0]
+    positive_cycle_times = cycle_times[cycle_times > 0]
+    median_tickets = np.median(positive_tickets) if positive_tickets.size else 0
+    median_cycle_time = np.median(positive_cycle_times) if positive_cycle_times.size else 0
     
     # Throughput Score: Based on ticket count
-    def calc_throughput_score(actual_tickets):
-        if actual_tickets <= 0 or median_tickets <= 0: return 0
-        if actual_tickets >= median_tickets:
-            # Above median: scale from baseline to excellence
-            score = MEDIAN_BASELINE_SCORE + (actual_tickets / median_tickets - 1) * EXCELLENCE_SCORE
-            return min(EXCELLENCE_SCORE, score)
-        else:
-            # Below median: scale proportionally down from baseline
-            return MEDIAN_BASELINE_SCORE * (actual_tickets / median_tickets)
-    
-    dashboard['Throughput Score'] = dashboard['Completed Tickets'].apply(calc_throughput_score).round(1)
+    ticket_ratio = np.zeros_like(tickets)
+    if median_tickets > 0:
+        ticket_ratio = tickets / median_tickets
+    throughput_score = np.where(
+        ticket_ratio >= 1,
+        # Above median: scale from baseline to excellence
+        np.minimum(EXCELLENCE_SCORE, MEDIAN_BASELINE_SCORE + (ticket_ratio - 1) * EXCELLENCE_SCORE),
+        # Below median: scale proportionally down from baseline
+        MEDIAN_BASELINE_SCORE * ticket_ratio
+    )
+    dashboard['Throughput Score'] = np.where(ticket_ratio > 0, throughput_score, 0).round(1)
     
     # Efficiency Score: Based on cycle time per ticket (inverse: lower is better)
-    def calc_efficiency_score(actual_cycle_time):
-        if actual_cycle_time <= 0 or median_cycle_time <= 0: return 0
-        if actual_cycle_time <= median_cycle_time:
-            # Better than median: scale from baseline to excellence
-            score = MEDIAN_BASELINE_SCORE + (1 - actual_cycle_time / median_cycle_time) * EXCELLENCE_SCORE
-            return min(EXCELLENCE_SCORE, score)
-        else:
-            # Worse than median: scale proportionally down from baseline
-            return MEDIAN_BASELINE_SCORE * (median_cycle_time / actual_cycle_time)
-    
-    dashboard['Efficiency Score'] = dashboard['Avg Cycle Time per Ticket'].apply(calc_efficiency_score).round(1)
+    cycle_ratio = np.zeros_like(cycle_times)
+    inverse_cycle_ratio = np.zeros_like(cycle_times)
+    if median_cycle_time > 0:
+        cycle_ratio = cycle_times / median_cycle_time
+        np.divide(median_cycle_time, cycle_times, out=inverse_cycle_ratio, where=cycle_times > 0)
+    efficiency_score = np.where(
+        cycle_ratio <= 1,
+        # Better than median: scale from baseline to excellence
+        np.minimum(EXCELLENCE_SCORE, MEDIAN_BASELINE_SCORE + (1 - cycle_ratio) * EXCELLENCE_SCORE),
+        # Worse than median: scale proportionally down from baseline
+        MEDIAN_BASELINE_SCORE * inverse_cycle_ratio
+    )
+    dashboard['Efficiency Score'] = np.where(cycle_ratio > 0, efficiency_score, 0).round(1)
     
     # Composite Velocity Score: weighted combination of throughput and efficiency
     dashboard['Velocity Score'] = (
@@ -185,13 +219,17 @@ def calculate_scores(metrics_df: pd.DataFrame, flow_df: pd.DataFrame) -> pd.Data
     ).round(1)
 
     # Quality Score: weighted combination of bug score and rejection score
-    dashboard['Quality Score'] = dashboard.apply(
-        lambda row: (row['Bug Score'] * QUALITY_WEIGHT_BUGS) + (row['Rejection Score'] * QUALITY_WEIGHT_REJECTIONS), axis=1
+    dashboard['Quality Score'] = (
+        (dashboard['Bug Score'] * QUALITY_WEIGHT_BUGS) + 
+        (dashboard['Rejection Score'] * QUALITY_WEIGHT_REJECTIONS)
     ).round(1)
     
-    # Flow Score: bounded between 0 and excellence score
-    dashboard['Flow Score'] = dashboard['Flow Survey Score'].apply(
-        lambda x: round(min(EXCELLENCE_SCORE, max(0, x)), 1) if pd.notna(x) else 0
+    # Flow Score: bounded between 0 and excellence score (missing values score 0)
+    # Rounded with Python's round(): Series.round rounds survey averages such as
+    # 39.45 the other way (39.4 instead of 39.5)
+    flow_survey_score = pd.to_numeric(dashboard['Flow Survey Score'], errors='coerce')
+    dashboard['Flow Score'] = flow_survey_score.clip(lower=0, upper=EXCELLENCE_SCORE).map(
+        lambda x: round(x, 1) if pd.notna(x) else 0
     )
     
     # FINAL IMPACT INDEX
@@ -204,13 +242,18 @@ def calculate_scores(metrics_df: pd.DataFrame, flow_df: pd.DataFrame) -> pd.Data
     ).round(1)
 
     # Sort by sprint date (already calculated during filtering)
-    dashboard['Sprint Start Date'] = dashboard['Sprint Name'].apply(_parse_sprint_date)
+    dashboard['Sprint Start Date'] = dashboard['Sprint Name'].map(sprint_date_map)
     dashboard.sort_values(by='Sprint Start Date', ascending=False, inplace=True)
     
     # Remove active sprint from dashboard (but its bugs were still counted for past sprints)
-    if not dashboard.empty:
-        most_recent_sprint_date = dashboard['Sprint Start Date'].max()
-        dashboard = dashboard[dashboard['Sprint Start Date'] < most_recent_sprint_date].copy()
+    # The active sprint only reaches the dashboard through the bug counts; it is kept until
+    # here so its survey data still feeds the flow score average, then dropped using the
+    # cutoff determined when filtering the metrics
+    if most_recent_sprint_date is not None:
+        dashboard = dashboard[
+            (dashboard['Sprint Start Date'] < most_recent_sprint_date) |
+            dashboard['Sprint Start Date'].isna()
+        ]
         logger.info(f"Removed active sprint from dashboard output")
 
     # Return final columns
@@ -238,64 +281,52 @@ def calculate_scores(metrics_df: pd.DataFrame, flow_df: pd.DataFrame) -> pd.Data
     return dashboard[final_cols]
 
 
-def _count_bugs_created_in_sprint_periods(metrics_df: pd.DataFrame) -> pd.DataFrame:
+def _count_bugs_created_in_sprint_periods(bug_dates: np.ndarray, sprint_date_map: dict) -> pd.DataFrame:
     """Count bugs created during each sprint's time period.
     
     Args:
-        metrics_df: DataFrame with all issues
+        bug_dates: Sorted datetime64 array of bug creation dates
+        sprint_date_map: Dictionary mapping sprint name to its start date
         
     Returns:
         DataFrame with Sprint Name and Bugs Created count
     """
     # Get all unique sprints and their date ranges
-    sprints = metrics_df[['Sprint Name', 'Sprint Start Date']].drop_duplicates()
-    sprints = sprints[sprints['Sprint Start Date'] != datetime.datetime.min].copy()
-    sprints = sprints.sort_values('Sprint Start Date')
+    sprints = pd.Series(sprint_date_map, dtype='datetime64[ns]')
+    sprints = sprints.dropna().sort_values()
     
     # Build date ranges (sprint duration from config)
-    sprint_ranges = []
-    for _, row in sprints.iterrows():
-        start_date = row['Sprint Start Date']
-        # Sprint period: start date to start date + configured duration
-        end_date = start_date + datetime.timedelta(days=SPRINT_DURATION_DAYS)
-        sprint_ranges.append({
-            'Sprint Name': row['Sprint Name'],
-            'Start': start_date,
-            'End': end_date
-        })
-    
-    # Count bugs created in each sprint period
-    bug_counts = []
-    for sprint_range in sprint_ranges:
-        # Filter bugs created during this sprint period
-        bugs_in_period = metrics_df[
-            (metrics_df['Issue Type'] == 'Bug') &
-            (metrics_df['Created Date Parsed'] >= sprint_range['Start']) &
-            (metrics_df['Created Date Parsed'] <= sprint_range['End'])
-        ]
-        bug_counts.append({
-            'Sprint Name': sprint_range['Sprint Name'],
-            'Bugs Created': len(bugs_in_period)
-        })
+    # Sprint period: start date to start date + configured duration
+    starts = sprints.to_numpy()
+    ends = starts + np.timedelta64(SPRINT_DURATION_DAYS, 'D')
+    
+    # Count bugs created in each sprint period with a single interval scan
+    # over the sorted bug creation dates (start and end are both inclusive).
+    # The periods are not contiguous (each ends at midnight of its last day and
+    # may overlap or leave gaps), so they cannot be treated as pd.cut bins.
+    bug_counts = (
+        np.searchsorted(bug_dates, ends, side='right') -
+        np.searchsorted(bug_dates, starts, side='left')
+    )
     
-    return pd.DataFrame(bug_counts)
+    return pd.DataFrame({
+        'Sprint Name': sprints.index.to_numpy(),
+        'Bugs Created': bug_counts
+    })
 
 
-def _parse_sprint_date(name):
-    """Parse date from sprint name in format 'Iteration MM.DD.YY'.
+def _parse_sprint_dates(sprint_names: pd.Series) -> dict:
+    """Parse dates from sprint names in format 'Iteration MM.DD.YY'.
+    
+    Parsing is done once per unique name in a single vectorized pass.
     
     Args:
-        name: Sprint name string
+        sprint_names: Series of sprint name strings
         
     Returns:
-        datetime object or datetime.min if parsing fails
+        Dictionary mapping sprint name to its Timestamp, or NaT if parsing fails
     """
-    if not isinstance(name, str): 
-        return datetime.datetime.min
-    try:
-        match = re.search(r'Iteration (\d{2}\.\d{2}\.\d{2})', name)
-        if match:
-            return datetime.datetime.strptime(match.group(1), '%m.%d.%y')
-    except:
-        pass
-    return datetime.datetime.min
+    unique_names = sprint_names.drop_duplicates()
+    date_strings = unique_names.str.extract(_SPRINT_DATE_RE, expand=False)
+    dates = pd.to_datetime(date_strings, format='%m.%d.%y', errors='coerce')
+    return dict(zip(unique_names, dates))
@@ -1,14 +1,24 @@
 """Jira client module for fetching and connecting to Jira."""
+import os
 import sys
+import json
+import datetime
 import logging
-from typing import List, Any
+from typing import List, Any, Optional, Dict
 from jira import JIRA
 from jira.exceptions import JIRAError
+from jira.resources import dict2resource
+try:
+    # Optional: faster (de)serialization of the issue cache
+    import orjson
+except ImportError:
+    orjson = None
 from config import (
     JIRA_URL,
     JIRA_USER,
     JIRA_TOKEN,
     JIRA_PROJECT_KEY,
+    JIRA_CACHE_DIR,
     FIELD_STORY_POINTS,
     FIELD_SPRINT,
     FIELD_TEAM_FILTER_KEY,
@@ -17,6 +27,28 @@ from config import (
 
 logger = logging.getLogger(__name__)
 
+# Requested page size; the server caps this (lower with the changelog expanded)
+# and the nextPageToken loop picks up whatever remains
+PAGE_SIZE = 1000
+
+# Issue fields consumed by the metrics processor, plus updated for the issue cache
+ISSUE_FIELDS = (
+    f'status,issuetype,created,updated,'
+    f'{FIELD_STORY_POINTS},{FIELD_SPRINT},{FIELD_TEAM_FILTER_KEY}'
+)
+
+# Issues per "key in (...)" query when fetching changelogs of new or updated issues,
+# keeping the JQL short
+CHANGELOG_KEY_BATCH_SIZE = 100
+
+# Changelog fields the metrics need (status transitions only), and the bulk
+# changelog endpoint's limit on issues per request
+CHANGELOG_FIELDS = ["status"]
+CHANGELOG_BATCH_SIZE = 1000
+
+# Changelog timestamp format the metrics processor parses
+_CHANGELOG_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S.%f%z'
+
 
 class JiraClient:
     """Handles Jira connection and data fetching."""
@@ -26,6 +58,12 @@ class JiraClient:
         self.team_filter = team_filter if team_filter is not None else FIELD_TEAM_FILTER_VALUE
         self._validate_credentials()
         self.client = self._connect()
+        self.bulk_changelog = True  # Cleared if the bulk changelog endpoint is unusable
+        self.cache_file = None
+        if JIRA_CACHE_DIR:
+            self.cache_file = os.path.join(
+                os.path.expanduser(JIRA_CACHE_DIR), f"{JIRA_PROJECT_KEY}_{self.team_filter}.json"
+            )
     
     @staticmethod
     def _validate_credentials():
@@ -45,41 +83,242 @@ class JiraClient:
     def fetch_issues(self) -> List[Any]:
         """Fetch recent issues from Jira with changelog.
         
+        When the issue cache is enabled, only new or updated issues are fetched with
+        their changelog; the others reuse their cached changelog.
+        
         Returns:
             List of Jira issue objects
         """
-        jql_query = (
+        jql_filter = (
             f'project = "{JIRA_PROJECT_KEY}" AND '
-            f'"{FIELD_TEAM_FILTER_KEY}" = "{self.team_filter}" '
-            f'ORDER BY created DESC'
+            f'"{FIELD_TEAM_FILTER_KEY}" = "{self.team_filter}"'
         )
         
-        logger.info(f"Fetching issues with JQL: {jql_query}")
-        issues = []
+        logger.info(f"Fetching issues with JQL: {jql_filter} ORDER BY created DESC")
         
         try:
-            next_token = None
+            cache = self._load_cache()
+            
+            if cache is None:
+                issues = self._search(f'{jql_filter} ORDER BY created DESC')
+            else:
+                issues = self._fetch_incremental(jql_filter, cache)
+            
+            logger.info(f"Fetched {len(issues)} issues via enhanced_search_issues.")
+            self._save_cache(issues)
+            return issues
+        except Exception as e:
+            logger.error(f"Error fetching Jira issues: {e}")
+            return []
+    
+    def _fetch_incremental(self, jql_filter: str, cache: Dict) -> List[Any]:
+        """Fetch every issue's fields and reuse the cached changelogs of unchanged issues.
+        
+        Renaming a sprint or editing its goal does not change an issue's updated
+        timestamp, so the fields are always fetched fresh (cheap without the
+        changelog). Only the changelog, which does bump updated, comes from the cache.
+        
+        Args:
+            jql_filter: JQL selecting the team's issues, without ordering
+            cache: Loaded cache with the raw issues by key
+            
+        Returns:
+            List of Jira issue objects, newest first
+        """
+        # Issues no longer matching the query drop out of the cache
+        issues = self._search(f'{jql_filter} ORDER BY created DESC', with_changelog=False)
+        
+        stale = []
+        for issue in issues:
+            cached = cache['issues'].get(issue.key)
+            if (cached is not None and 'changelog' in cached and
+                    cached['fields'].get('updated') == issue.raw['fields'].get('updated')):
+                _set_changelog(issue, cached['changelog'])
+            else:
+                stale.append(issue)
+        
+        self._fetch_changelogs(stale)
+        logger.info(f"Fetched changelogs of {len(stale)} new or updated issues; {len(issues) - len(stale)} served from cache.")
+        # An issue deleted between the two queries has no changelog to report
+        return [issue for issue in issues if 'changelog' in issue.raw]
+    
+    def _fetch_changelogs(self, issues: List[Any]):
+        """Fetch the status changelogs of the given issues and attach them as issue.changelog.
+        
+        Status changelogs come from the bulk changelog endpoint filtered to the status
+        field, which is far smaller than expanding the full changelog; when that endpoint
+        fails or returns timestamps the metrics cannot parse, the full changelogs are
+        fetched by key with expand='changelog' instead.
+        
+        Args:
+            issues: Jira issue objects fetched without the changelog expanded
+        """
+        if self.bulk_changelog:
+            try:
+                self._attach_status_changelogs(issues)
+                return
+            except Exception as e:
+                logger.warning(f"Bulk changelog fetch failed ({e}); falling back to expand='changelog'.")
+                self.bulk_changelog = False
+        
+        issues_by_key = {issue.key: issue for issue in issues}
+        keys = list(issues_by_key)
+        for start in range(0, len(keys), CHANGELOG_KEY_BATCH_SIZE):
+            batch = ", ".join(keys[start:start + CHANGELOG_KEY_BATCH_SIZE])
+            for fetched in self._search_pages(f'key in ({batch})', 'key', expand='changelog'):
+                _set_changelog(issues_by_key[fetched.key], fetched.raw['changelog'])
+    
+    def _attach_status_changelogs(self, issues: List[Any]):
+        """Fetch status-only changelogs in bulk and attach them as issue.changelog.
+        
+        The python jira package has no wrapper for changelog/bulkfetch, so this posts
+        through the client's private _get_url and _session and may need updating when
+        the package changes them.
+        
+        Args:
+            issues: Jira issue objects fetched without the changelog expanded
+            
+        Raises:
+            ValueError: If a change history timestamp is not a Jira ISO timestamp
+        """
+        url = self.client._get_url('changelog/bulkfetch')
+        histories_by_id = {issue.id: [] for issue in issues}
+        issue_ids = list(histories_by_id)
+        
+        for start in range(0, len(issue_ids), CHANGELOG_BATCH_SIZE):
+            body = {
+                "issueIdsOrKeys": issue_ids[start:start + CHANGELOG_BATCH_SIZE],
+                "fieldIds": CHANGELOG_FIELDS,
+                "maxResults": CHANGELOG_BATCH_SIZE
+            }
             while True:
-                kwargs = {
-                    "maxResults": 100,
-                    "expand": 'changelog',
-                    "fields": (
-                        f'summary,status,issuetype,created,updated,'
-                        f'{FIELD_STORY_POINTS},{FIELD_SPRINT},{FIELD_TEAM_FILTER_KEY}'
+                data = self.client._session.post(url, data=json.dumps(body)).json()
+                for issue_log in data.get('issueChangeLogs', []):
+                    histories_by_id.setdefault(issue_log['issueId'], []).extend(
+                        issue_log.get('changeHistories', [])
                     )
-                }
-                if next_token:
-                    kwargs['nextPageToken'] = next_token
-                    
-                fetched = self.client.enhanced_search_issues(jql_query, **kwargs)
-                issues.extend(fetched)
                 
-                next_token = getattr(fetched, 'nextPageToken', None)
+                next_token = data.get('nextPageToken')
                 if not next_token:
                     break
-                    
-            logger.info(f"Fetched {len(issues)} issues via enhanced_search_issues.")
-            return issues
+                body['nextPageToken'] = next_token
+        
+        # The metrics parse history timestamps as Jira ISO strings, so a payload in any
+        # other form (e.g. epoch milliseconds) must not replace the expanded changelog
+        for histories in histories_by_id.values():
+            for history in histories:
+                created = history.get('created')
+                if not isinstance(created, str):
+                    raise ValueError(f"unexpected changelog timestamp {created!r}")
+                datetime.datetime.strptime(created, _CHANGELOG_TIMESTAMP_FORMAT)
+        
+        for issue in issues:
+            _set_changelog(issue, {"histories": histories_by_id[issue.id]})
+    
+    def _search(self, jql_query: str, fields: str = ISSUE_FIELDS, with_changelog: bool = True) -> List[Any]:
+        """Run a JQL search, attaching each issue's status changelog if requested.
+        
+        Args:
+            jql_query: JQL query string
+            fields: Comma separated issue fields to return
+            with_changelog: Whether issue.changelog is needed
+            
+        Returns:
+            List of Jira issue objects
+        """
+        issues = self._search_pages(jql_query, fields)
+        if with_changelog:
+            self._fetch_changelogs(issues)
+        return issues
+    
+    def _search_pages(self, jql_query: str, fields: str, expand: Optional[str] = None) -> List[Any]:
+        """Run a JQL search, following nextPageToken until all pages are fetched.
+        
+        Args:
+            jql_query: JQL query string
+            fields: Comma separated issue fields to return
+            expand: Issue expansions to request (None for none)
+            
+        Returns:
+            List of Jira issue objects
+        """
+        issues = []
+        next_token = None
+        while True:
+            kwargs = {
+                "maxResults": PAGE_SIZE,
+                "fields": fields
+            }
+            if expand:
+                kwargs['expand'] = expand
+            if next_token:
+                kwargs['nextPageToken'] = next_token
+                
+            fetched = self.client.enhanced_search_issues(jql_query, **kwargs)
+            issues.extend(fetched)
+            
+            next_token = getattr(fetched, 'nextPageToken', None)
+            if not next_token:
+                break
+        return issues
+    
+    def _load_cache(self) -> Optional[Dict]:
+        """Load the issue cache from disk.
+        
+        Returns:
+            Cache dictionary, or None if caching is disabled or no usable cache exists
+        """
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return None
+        try:
+            with open(self.cache_file, 'rb') as f:
+                cache = _json_loads(f.read())
+            if cache.get('fields') != ISSUE_FIELDS:
+                logger.info("Issue cache was written for different fields. Fetching all issues.")
+                return None
+            logger.info(f"Loaded {len(cache['issues'])} cached issues from {self.cache_file}")
+            return cache
         except Exception as e:
-            logger.error(f"Error fetching Jira issues: {e}")
-            return []
+            logger.warning(f"Could not read issue cache {self.cache_file}: {e}")
+            return None
+    
+    def _save_cache(self, issues: List[Any]):
+        """Write the fetched issues to the cache, replacing the previous file.
+        
+        Args:
+            issues: Jira issue objects fetched with changelog
+        """
+        if not self.cache_file:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            cache = {
+                "fields": ISSUE_FIELDS,
+                "issues": {issue.key: issue.raw for issue in issues}
+            }
+            tmp_file = f"{self.cache_file}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(_json_dumps(cache))
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            logger.warning(f"Could not write issue cache {self.cache_file}: {e}")
+
+
+def _set_changelog(issue, changelog: Dict):
+    """Attach a raw changelog to an issue, keeping it in the raw payload for the cache."""
+    issue.raw['changelog'] = changelog
+    issue.changelog = dict2resource(changelog)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode an object as UTF-8 JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
@@ -1,14 +1,9 @@
 import logging
 import sys
-import pandas as pd
-from jira_client import JiraClient
-from sheets_client import SheetsClient
-from metrics_processor import process_issue_metrics, load_flow_data
-from dashboard_calculator import calculate_scores
+import datetime
+from concurrent.futures import ThreadPoolExecutor
 from config import FIELD_TEAM_FILTER_VALUE
 
-# Setup Logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class TeamImpactDashboard:
@@ -16,12 +11,19 @@ class TeamImpactDashboard:
     
     def __init__(self, team_filter=None):
         """Initialize dashboard with Jira and Sheets clients."""
+        # Imported here so main() can answer --help without loading jira/pandas
+        from jira_client import JiraClient
+        from sheets_client import SheetsClient
+        
         self.team_filter = team_filter if team_filter is not None else FIELD_TEAM_FILTER_VALUE
         self.jira_client = JiraClient(team_filter=self.team_filter)
         self.sheets_client = SheetsClient(team_filter=self.team_filter)
     
     def run(self):
         """Run the complete dashboard generation process."""
+        from metrics_processor import build_raw_metrics, load_flow_data
+        from dashboard_calculator import calculate_scores
+        
         logger.info("Starting Team AI Impact Index Build...")
         
         # 1. Fetch External Data
@@ -32,37 +34,40 @@ class TeamImpactDashboard:
             logger.warning("No issues found. Exiting.")
             return
 
-        # 2. Process Raw Metrics
-        raw_metrics = []
-        for issue in jira_issues:
-            try:
-                metrics = process_issue_metrics(issue, team_filter=self.team_filter)
-                if metrics:
-                    raw_metrics.append(metrics)
-            except Exception as e:
-                logger.warning(f"Error processing issue {issue.key}: {e}")
-        
-        raw_df = pd.DataFrame(raw_metrics)
-        
-        # 3. Calculate Aggregated Dashboard
-        dashboard_df = calculate_scores(raw_df, flow_df)
-        
-        # 4. Display in Console for Verification
-        preview = False
-        if preview:
-            print("\n--- EXECUTIVE DASHBOARD PREVIEW ---")
-            print(dashboard_df.to_string(index=False))
-            print("\n-----------------------------------")
-
-        # 5. Push to Google Sheets
-        self.sheets_client.update_sheets(raw_df, dashboard_df)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Open the spreadsheet in the background while metrics are computed
+            worksheets = None
+            if self.sheets_client.client:
+                worksheets = executor.submit(self.sheets_client.open_worksheets)
+            
+            # 2. Process Raw Metrics (whole batch at once, against a single "now")
+            now_utc = datetime.datetime.now(datetime.timezone.utc)
+            raw_df = build_raw_metrics(jira_issues, team_filter=self.team_filter, now_utc=now_utc)
+            
+            # 3. Calculate Aggregated Dashboard
+            dashboard_df = calculate_scores(raw_df, flow_df)
+            
+            # 4. Push to Google Sheets
+            self.sheets_client.update_sheets(raw_df, dashboard_df, worksheets=worksheets)
         logger.info("Done.")
 
 
-if __name__ == "__main__":
+def main():
+    """Parse command-line arguments and run the dashboard."""
+    if len(sys.argv) > 1 and sys.argv[1] in ("-h", "--help"):
+        print("Usage: python3 main.py [team_filter]")
+        sys.exit(0)
+    
+    # Setup Logging
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    
     # Parse command-line arguments
     team_filter = sys.argv[1] if len(sys.argv) > 1 else FIELD_TEAM_FILTER_VALUE
     logger.info(f"Running dashboard for team: {team_filter}")
     
     app = TeamImpactDashboard(team_filter=team_filter)
     app.run()
+
+
+if __name__ == "__main__":
+    main()
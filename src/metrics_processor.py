@@ -3,7 +3,10 @@ import os
 import logging
 import datetime
 import re
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from operator import attrgetter
+from typing import Optional, List, Tuple
+import numpy as np
 import pandas as pd
 from config import (
     FIELD_STORY_POINTS,
@@ -15,74 +18,310 @@ from config import (
 
 logger = logging.getLogger(__name__)
 
+# Changelog statuses (normalized) whose time counts toward cycle time
+IN_PROGRESS_STATUSES = ["started", "peer review", "finished", "delivered"]
 
-def calculate_business_days(start_datetime, end_datetime) -> float:
-    """Calculate the number of business days (excluding weekends) between two datetimes.
+_JIRA_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S.%f%z'
+_JIRA_LOCAL_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+_UTC_OFFSET_RE = re.compile(r'(?:Z|[+-]\d{2}:?\d{2})$')
+
+# Columns of the raw metrics table, in output order
+RAW_METRICS_COLUMNS = [
+    "Issue Key",
+    "Issue Type",
+    "Story Points",
+    "Sprint Name",
+    "Days In Progress",
+    "Dev Cycle Time",
+    "Review Cycle Time",
+    "Acceptance Cycle Time",
+    "Rejection Count",
+    "Reached Delivered",
+    "Status",
+    "Timestamp",
+    "Was Rejected?",
+    "Created Date",
+    "Sprint Start Date"
+]
+
+# Columns read directly from each issue, in the order of _extract_issue_record's fields tuple
+ISSUE_FIELD_COLUMNS = [
+    "Issue Key",
+    "Issue Type",
+    "Story Points",
+    "Sprint Name",
+    "Reached Delivered",
+    "Status",
+    "Sprint Start Date"
+]
+
+# Repeated string columns stored as categoricals (a few distinct values each)
+RAW_METRICS_CATEGORIES = {
+    "Issue Type": "category",
+    "Sprint Name": "category",
+    "Status": "category",
+    "Was Rejected?": "category"
+}
+
+# Column types of the flow survey CSV
+FLOW_DATA_DTYPES = {"sprint_name": str, "flow_score_raw": "float64"}
+
+# Sprint name patterns: "Iteration MM.DD.YY" (start date) and the name in a raw sprint string
+_SPRINT_DATE_RE = re.compile(r'Iteration (\d{2}\.\d{2}\.\d{2})')
+_SPRINT_NAME_RE = re.compile(r'name=([^,]+)')
+
+
+_US_PER_SECOND = 10**6
+_US_PER_DAY = 86400 * _US_PER_SECOND
+
+
+def business_days_between(start_local_us, end_local_us, start_utc_us, end_utc_us) -> np.ndarray:
+    """Calculate the business days (excluding weekends) of each period in one pass.
+    
+    Weekdays are counted in closed form with np.busday_count instead of iterating
+    day by day. Dates and partial days follow each endpoint's own wall clock, while
+    the elapsed time of a same-day span is measured in UTC.
     
     Args:
-        start_datetime: Start datetime (timezone aware)
-        end_datetime: End datetime (timezone aware)
+        start_local_us: int64 microseconds since epoch of the start, in its local time
+        end_local_us: int64 microseconds since epoch of the end, in its local time
+        start_utc_us: int64 microseconds since epoch of the start, in UTC
+        end_utc_us: int64 microseconds since epoch of the end, in UTC
         
     Returns:
-        float: Number of business days (excluding weekends)
+        Array of business days (excluding weekends), one per period
     """
-    if start_datetime >= end_datetime:
-        return 0.0
-    
-    # Convert to date objects for date iteration
-    start_date = start_datetime.date()
-    end_date = end_datetime.date()
-    
-    # Count full business days
-    business_days = 0
-    current_date = start_date
-    
-    while current_date < end_date:
-        # Monday = 0, Sunday = 6
-        if current_date.weekday() < 5:  # Monday-Friday
-            business_days += 1
-        current_date += datetime.timedelta(days=1)
-    
-    # Handle partial days at start and end
-    # Calculate what fraction of the first and last day to include
-    total_seconds = (end_datetime - start_datetime).total_seconds()
-    
-    if business_days == 0:
-        # Duration is within a single day or only weekend days
-        if start_datetime.weekday() < 5:  # weekday
-            return total_seconds / 86400
-        else:  # weekend
-            return 0.0
-    
-    # For multi-day spans, adjust for partial days
-    # Start partial day
-    start_end_of_day = datetime.datetime.combine(start_date, datetime.time.max).replace(tzinfo=start_datetime.tzinfo)
-    start_partial = 0.0
-    if start_datetime.weekday() < 5:  # weekday
-        seconds_in_first_day = (start_end_of_day - start_datetime).total_seconds()
-        start_partial = seconds_in_first_day / 86400
-        business_days -= 1  # Remove the full day we counted
-    
-    # End partial day
-    end_start_of_day = datetime.datetime.combine(end_date, datetime.time.min).replace(tzinfo=end_datetime.tzinfo)
-    end_partial = 0.0
-    if end_datetime.weekday() < 5:  # weekday
-        seconds_in_last_day = (end_datetime - end_start_of_day).total_seconds()
-        end_partial = seconds_in_last_day / 86400
-        business_days -= 1  # Remove the full day we counted
-    
-    return business_days + start_partial + end_partial
-
-
-def process_issue_metrics(issue, team_filter=None) -> Optional[Dict]:
-    """Calculate raw metrics for a single issue. Returns None if issue should be filtered out.
+    start_day = start_local_us // _US_PER_DAY
+    end_day = end_local_us // _US_PER_DAY
+    start_date = start_day.astype('datetime64[D]')
+    end_date = end_day.astype('datetime64[D]')
+    
+    # Count full business days in [start_date, end_date)
+    business_days = np.busday_count(start_date, np.maximum(start_date, end_date))
+    start_is_weekday = np.is_busday(start_date)
+    end_is_weekday = np.is_busday(end_date)
+    
+    # Duration is within a single day or only weekend days
+    total_seconds = (end_utc_us - start_utc_us) / _US_PER_SECOND
+    single_day = np.where(start_is_weekday, total_seconds / 86400, 0.0)
+    
+    # For multi-day spans, swap the first and last counted days for their partial fractions
+    # (the first day runs until 23:59:59.999999, matching datetime.time.max)
+    seconds_in_first_day = (_US_PER_DAY - 1 - (start_local_us - start_day * _US_PER_DAY)) / _US_PER_SECOND
+    seconds_in_last_day = (end_local_us - end_day * _US_PER_DAY) / _US_PER_SECOND
+    start_partial = np.where(start_is_weekday, seconds_in_first_day / 86400, 0.0)
+    end_partial = np.where(end_is_weekday, seconds_in_last_day / 86400, 0.0)
+    full_days = business_days - start_is_weekday.astype(np.int64) - end_is_weekday.astype(np.int64)
+    multi_day = full_days + start_partial + end_partial
+    
+    result = np.where(business_days == 0, single_day, multi_day)
+    return np.where(start_utc_us >= end_utc_us, 0.0, result)
+
+
+def _to_epoch_microseconds(datetimes) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert timezone aware datetimes to int64 microseconds since epoch.
+    
+    Returns:
+        Tuple of (local wall clock microseconds, UTC microseconds) arrays
+    """
+    local_us = np.array(
+        [dt.replace(tzinfo=None) for dt in datetimes], dtype='datetime64[us]'
+    ).view(np.int64)
+    offsets_us = np.array(
+        [dt.utcoffset() // datetime.timedelta(microseconds=1) for dt in datetimes], dtype=np.int64
+    )
+    return local_us, local_us - offsets_us
+
+
+def build_raw_metrics(issues, team_filter=None, now_utc=None) -> pd.DataFrame:
+    """Calculate raw metrics for a batch of issues.
+    
+    Each issue is visited once to collect its fields, timestamps and status
+    transitions into flat arrays; status periods, rejections and the cycle time
+    buckets are then derived for the whole batch with NumPy. Issues filtered out by
+    sprint goal, or failing to process, are skipped.
+    
+    Args:
+        issues: Iterable of Jira issue objects
+        team_filter: Team filter value for sprint goal filtering
+        now_utc: Timezone aware "now" closing in-progress periods and stamping the
+            rows (defaults to the current time)
+        
+    Returns:
+        DataFrame with one row of metrics per issue
+    """
+    # Per-issue field tuples, transposed into columns once all issues are collected
+    issue_fields = []
+    
+    # Raw Jira timestamps of every issue (created, then each history) and their owner
+    timestamps = []
+    timestamp_issue = []
+    created_pos = []
+    
+    # Status transitions of all issues as flat arrays: issue index, position of the
+    # change in timestamps, and the normalized from/to statuses
+    trans_issue = []
+    trans_pos = []
+    trans_from = []
+    trans_to = []
+    
+    if now_utc is None:
+        now_utc = datetime.datetime.now(datetime.timezone.utc)
+    
+    for issue in issues:
+        try:
+            extracted = _extract_issue_record(issue, team_filter)
+        except Exception as e:
+            logger.warning(f"Error processing issue {issue.key}: {e}")
+            continue
+        if extracted is None:
+            continue
+        
+        fields, created, history_times, transitions = extracted
+        issue_idx = len(issue_fields)
+        issue_fields.append(fields)
+        
+        # The issue's history timestamps directly follow its created timestamp
+        history_offset = len(timestamps) + 1
+        created_pos.append(len(timestamps))
+        timestamps.append(created)
+        timestamps.extend(history_times)
+        timestamp_issue.extend([issue_idx] * (len(history_times) + 1))
+        
+        history_positions, from_statuses, to_statuses = transitions
+        trans_issue.extend([issue_idx] * len(history_positions))
+        trans_pos.extend(history_offset + pos for pos in history_positions)
+        trans_from.extend(from_statuses)
+        trans_to.extend(to_statuses)
+    
+    if not issue_fields:
+        return pd.DataFrame()
+    
+    num_issues = len(issue_fields)
+    columns = {column: list(values) for column, values in zip(ISSUE_FIELD_COLUMNS, zip(*issue_fields))}
+    created_pos = np.asarray(created_pos, dtype=np.intp)
+    trans_issue = np.asarray(trans_issue, dtype=np.intp)
+    trans_pos = np.asarray(trans_pos, dtype=np.intp)
+    trans_from = np.asarray(trans_from, dtype=object)
+    trans_to = np.asarray(trans_to, dtype=object)
+    
+    # Each transition closes the period spent in the previous status of the same
+    # issue; an issue's first period starts "To Do" at its created timestamp
+    is_first = np.ones(len(trans_issue), dtype=bool)
+    is_first[1:] = trans_issue[1:] != trans_issue[:-1]
+    is_last = np.ones(len(trans_issue), dtype=bool)
+    is_last[:-1] = is_first[1:]
+    
+    prev_pos = np.roll(trans_pos, 1)
+    prev_pos[is_first] = created_pos[trans_issue[is_first]]
+    prev_status = np.roll(trans_to, 1)
+    prev_status[is_first] = "To Do"
+    
+    # The status after the last transition stays open until now (position -1)
+    open_pos = created_pos.copy()
+    open_pos[trans_issue[is_last]] = trans_pos[is_last]
+    open_status = np.full(num_issues, "To Do", dtype=object)
+    open_status[trans_issue[is_last]] = trans_to[is_last]
+    
+    # Periods ordered per issue as the changelog walk would visit them
+    period_issue = np.concatenate([trans_issue, np.arange(num_issues, dtype=np.intp)])
+    period_start = np.concatenate([prev_pos, open_pos])
+    period_end = np.concatenate([trans_pos, np.full(num_issues, -1, dtype=np.intp)])
+    period_status = np.concatenate([prev_status, open_status])
+    
+    # Track Rejections (Delivered -> Rejected)
+    rejected = (trans_from == 'delivered') & (trans_to == 'rejected')
+    rejection_counts = np.bincount(trans_issue[rejected], minlength=num_issues)
+    
+    # Parse every timestamp in one pass; skip issues with any unparseable timestamp
+    local_us, utc_us, parsed = _parse_jira_timestamps(timestamps)
+    timestamp_issue = np.asarray(timestamp_issue, dtype=np.intp)
+    keep = np.bincount(timestamp_issue[~parsed], minlength=num_issues) == 0
+    for issue_idx in np.flatnonzero(~keep):
+        logger.warning(f"Error processing issue {columns['Issue Key'][issue_idx]}: unparseable timestamp")
+    if not keep.any():
+        return pd.DataFrame()
+    
+    now_local_us, now_utc_us = _to_epoch_microseconds([now_utc])
+    local_us = np.append(local_us, now_local_us)
+    utc_us = np.append(utc_us, now_utc_us)
+    
+    # Only time spent in progress counts, and only for issues being kept
+    period_kept = np.isin(period_status, IN_PROGRESS_STATUSES) & keep[period_issue]
+    period_issue = period_issue[period_kept]
+    period_start = period_start[period_kept]
+    period_end = period_end[period_kept]
+    period_status = period_status[period_kept]
+    
+    # Business days per period (excluding weekends)
+    durations = business_days_between(
+        local_us[period_start], local_us[period_end], utc_us[period_start], utc_us[period_end]
+    )
+    
+    def _sum_per_issue(mask):
+        # bincount returns integers when nothing is selected, so force float sums
+        sums = np.bincount(period_issue[mask], weights=durations[mask], minlength=num_issues)
+        # Python's round() so ties like 2.675 round the same as the per-issue loop did
+        return np.array([round(total, 2) for total in sums.tolist()], dtype=float)
+    
+    # All periods are in progress; break out into specific cycle time buckets
+    columns['Days In Progress'] = _sum_per_issue(slice(None))
+    columns['Dev Cycle Time'] = _sum_per_issue(period_status == "started")
+    columns['Review Cycle Time'] = _sum_per_issue(
+        (period_status == "peer review") | (period_status == "finished")
+    )
+    columns['Acceptance Cycle Time'] = _sum_per_issue(period_status == "delivered")
+    
+    columns['Rejection Count'] = rejection_counts
+    columns['Was Rejected?'] = np.where(rejection_counts > 0, "Yes", "No").astype(object)
+    # Run timestamp in local time, timezone-naive
+    columns['Timestamp'] = [now_utc.astimezone().replace(tzinfo=None).isoformat()] * num_issues
+    
+    # Created date in its local time, timezone-naive (isoformat drops a zero fraction)
+    created_local = local_us[created_pos]
+    created_dates = created_local.astype('datetime64[us]')
+    columns['Created Date'] = np.where(
+        created_local % _US_PER_SECOND == 0,
+        np.datetime_as_string(created_dates, unit='s'),
+        np.datetime_as_string(created_dates, unit='us')
+    ).astype(object)
+    
+    raw_df = pd.DataFrame({column: columns[column] for column in RAW_METRICS_COLUMNS})
+    raw_df = raw_df.astype(RAW_METRICS_CATEGORIES)
+    return raw_df[keep].reset_index(drop=True)
+
+
+def _parse_jira_timestamps(timestamps) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parse Jira ISO timestamps (e.g. 2024-01-05T10:20:30.123+0000) in one vectorized pass.
+    
+    Args:
+        timestamps: Sequence of raw timestamp strings
+        
+    Returns:
+        Tuple of (local wall clock microseconds, UTC microseconds, parsed mask) arrays
+    """
+    raw = pd.Index(timestamps, dtype=object)
+    utc = pd.to_datetime(raw, format=_JIRA_TIMESTAMP_FORMAT, utc=True, errors='coerce')
+    local = pd.to_datetime(
+        raw.str.replace(_UTC_OFFSET_RE, '', regex=True),
+        format=_JIRA_LOCAL_TIMESTAMP_FORMAT,
+        errors='coerce'
+    )
+    parsed = ~(np.asarray(utc.isna()) | np.asarray(local.isna()))
+    return local.as_unit('us').asi8, utc.as_unit('us').asi8, parsed
+
+
+def _extract_issue_record(issue, team_filter=None) -> Optional[Tuple[Tuple, str, List[str], Tuple[List, List, List]]]:
+    """Collect the per-issue fields and status transitions of a single issue.
     
     Args:
         issue: Jira issue object
         team_filter: Team filter value for sprint goal filtering
         
     Returns:
-        Dictionary of metrics or None if issue should be filtered
+        Tuple of (field values in ISSUE_FIELD_COLUMNS order, raw created timestamp, raw
+        history timestamps, (history positions, from statuses, to statuses) of the
+        status transitions), or None if the issue should be filtered
     """
     if team_filter is None:
         team_filter = FIELD_TEAM_FILTER_VALUE
@@ -94,10 +333,6 @@ def process_issue_metrics(issue, team_filter=None) -> Optional[Dict]:
     if sp is None: sp = 0
     story_points = float(sp)
 
-    # Analyze Changelog first to determine completion date
-    changelog = issue.changelog
-    histories = sorted(changelog.histories, key=lambda x: x.created)
-    
     # Get Sprint Name - use the sprint with the latest start date
     sprint_name = "Unknown Sprint"
     last_sprint = None
@@ -114,18 +349,12 @@ def process_issue_metrics(issue, team_filter=None) -> Optional[Dict]:
             elif isinstance(s, dict) and 'name' in s:
                 s_name_temp = s['name']
             elif isinstance(s, str):
-                match = re.search(r'name=([^,]+)', s)
+                match = _SPRINT_NAME_RE.search(s)
                 if match: s_name_temp = match.group(1)
                 else: s_name_temp = s
             
-            # Parse date
-            current_date = datetime.datetime.min
-            # Regex for "Iteration MM.DD.YY" (Start Date)
-            d_match = re.search(r'Iteration (\d{2}\.\d{2}\.\d{2})', s_name_temp)
-            if d_match:
-                try:
-                    current_date = datetime.datetime.strptime(d_match.group(1), '%m.%d.%y')
-                except: pass
+            # Parse date (the same iteration names repeat across issues)
+            current_date = _parse_sprint_start_date(s_name_temp)
             
             if current_date >= best_date:
                 best_date = current_date
@@ -145,74 +374,30 @@ def process_issue_metrics(issue, team_filter=None) -> Optional[Dict]:
             # Skip this issue as it belongs to another team
             return None
 
-    # Calculate In Progress Time & Rejections (excluding weekends)
-    time_in_progress_days = 0.0
-    dev_time_days = 0.0  # Time in "started"
-    review_time_days = 0.0  # Time in "peer review" and "finished"
-    acceptance_time_days = 0.0  # Time in "delivered"
-    rejection_count = 0
-    was_rejected = False
-    
-    current_status = "To Do"
-    last_change_time = datetime.datetime.strptime(issue.fields.created, '%Y-%m-%dT%H:%M:%S.%f%z')
+    # Analyze Changelog only once the issue has passed the sprint goal filter
+    changelog = issue.changelog
+    # Jira usually returns histories in order, which Timsort handles in a single pass
+    histories = sorted(changelog.histories, key=attrgetter('created'))
     
-    for history in histories:
-        change_time = datetime.datetime.strptime(history.created, '%Y-%m-%dT%H:%M:%S.%f%z')
-        
-        for item in history.items:
-            if item.field == 'status':
-                # Normalize statuses: remove dashes, trim spaces, lowercase
-                from_status = item.fromString.strip('- ').lower() if item.fromString else ""
-                to_status = item.toString.strip('- ').lower() if item.toString else ""
-                
-                # Accumulate time based on current state (excluding weekends)
-                duration_days = calculate_business_days(last_change_time, change_time)
-                
-                if current_status in ["started", "peer review", "finished", "delivered"]:
-                    time_in_progress_days += duration_days
-                    
-                    # Break out into specific cycle time buckets
-                    if current_status == "started":
-                        dev_time_days += duration_days
-                    elif current_status in ["peer review", "finished"]:
-                        review_time_days += duration_days
-                    elif current_status == "delivered":
-                        acceptance_time_days += duration_days
-
-                # Track Rejections (Delivered -> Rejected)
-                if from_status == 'delivered' and to_status == 'rejected':
-                    rejection_count += 1
-                    was_rejected = True
-                
-                # Update state
-                current_status = to_status
-                last_change_time = change_time
-
-    # If currently in progress, add time until now (excluding weekends)
-    if current_status in ["started", "peer review", "finished", "delivered"]:
-        now = datetime.datetime.now(datetime.timezone.utc)
-        duration_days = calculate_business_days(last_change_time, now)
-        time_in_progress_days += duration_days
-        
-        # Break out into specific cycle time buckets
-        if current_status == "started":
-            dev_time_days += duration_days
-        elif current_status in ["peer review", "finished"]:
-            review_time_days += duration_days
-        elif current_status == "delivered":
-            acceptance_time_days += duration_days
-
-    days_in_progress = round(time_in_progress_days, 2)
-    days_dev = round(dev_time_days, 2)
-    days_review = round(review_time_days, 2)
-    days_acceptance = round(acceptance_time_days, 2)
+    # Collect status transitions as parallel lists; timestamps are parsed for the
+    # whole batch at once
+    history_times = [history.created for history in histories]
+    status_items = [
+        (history_pos, item)
+        for history_pos, history in enumerate(histories)
+        for item in history.items
+        if item.field == 'status'
+    ]
+    transitions = (
+        [history_pos for history_pos, _ in status_items],
+        [_normalize_changelog_status(item.fromString) for _, item in status_items],
+        [_normalize_changelog_status(item.toString) for _, item in status_items]
+    )
 
     # Robust Status Check
-    raw_status = str(issue.fields.status)
-    if hasattr(issue.fields.status, 'name'):
-        raw_status = issue.fields.status.name
-        
-    status_clean = raw_status.lower().replace("-", "").strip()
+    status = issue.fields.status
+    raw_status = status.name if hasattr(status, 'name') else str(status)
+    status_clean = _normalize_issue_status(raw_status)
     is_done = status_clean in COMPLETION_STATUSES
     
     # 'Delivered' count logic
@@ -226,37 +411,45 @@ def process_issue_metrics(issue, team_filter=None) -> Optional[Dict]:
         else:
             issue_type = str(issue.fields.issuetype)
     
-    # Get Created Date
-    created_date = None
-    if hasattr(issue.fields, 'created') and issue.fields.created:
+    # Cycle times, rejections, the timestamp and the created date are filled in by build_raw_metrics
+    fields = (
+        key,
+        issue_type,
+        story_points,
+        sprint_name,
+        reached_delivered,
+        status_clean.title(),
+        best_date.isoformat() if best_date != datetime.datetime.min else None
+    )
+    return fields, issue.fields.created, history_times, transitions
+
+
+@lru_cache(maxsize=512)
+def _parse_sprint_start_date(sprint_name: str) -> datetime.datetime:
+    """Parse the start date from an "Iteration MM.DD.YY" sprint name.
+    
+    Returns:
+        Sprint start datetime, or datetime.min if the name has no parseable date
+    """
+    d_match = _SPRINT_DATE_RE.search(sprint_name)
+    if d_match:
         try:
-            created_date = datetime.datetime.strptime(issue.fields.created, '%Y-%m-%dT%H:%M:%S.%f%z')
-            # Convert to timezone-naive for comparison
-            created_date = created_date.replace(tzinfo=None)
+            return datetime.datetime.strptime(d_match.group(1), '%m.%d.%y')
         except ValueError:
-            try:
-                created_date = datetime.datetime.strptime(issue.fields.created, '%Y-%m-%dT%H:%M:%S%z')
-                created_date = created_date.replace(tzinfo=None)
-            except ValueError:
-                logger.warning(f"Could not parse created date for {key}: {issue.fields.created}")
-
-    return {
-        "Issue Key": key,
-        "Issue Type": issue_type,
-        "Story Points": story_points,
-        "Sprint Name": sprint_name,
-        "Days In Progress": days_in_progress,
-        "Dev Cycle Time": days_dev,
-        "Review Cycle Time": days_review,
-        "Acceptance Cycle Time": days_acceptance,
-        "Rejection Count": rejection_count,
-        "Reached Delivered": reached_delivered,
-        "Status": status_clean.title(),
-        "Timestamp": datetime.datetime.now().isoformat(),
-        "Was Rejected?": "Yes" if was_rejected else "No",
-        "Created Date": created_date.isoformat() if created_date else None,
-        "Sprint Start Date": best_date.isoformat() if best_date != datetime.datetime.min else None
-    }
+            pass
+    return datetime.datetime.min
+
+
+@lru_cache(maxsize=64)
+def _normalize_issue_status(raw_status: str) -> str:
+    """Normalize an issue status name: lowercase, remove dashes, trim spaces."""
+    return raw_status.lower().replace("-", "").strip()
+
+
+@lru_cache(maxsize=256)
+def _normalize_changelog_status(status: Optional[str]) -> str:
+    """Normalize a changelog status: remove dashes, trim spaces, lowercase."""
+    return status.strip('- ').lower() if status else ""
 
 
 def load_flow_data(team_filter: str = FIELD_TEAM_FILTER_VALUE) -> pd.DataFrame:
@@ -277,10 +470,11 @@ def load_flow_data(team_filter: str = FIELD_TEAM_FILTER_VALUE) -> pd.DataFrame:
         return pd.DataFrame(columns=["sprint_name", "flow_score_raw"])
     
     try:
-        df = pd.read_csv(flow_file)
+        # Declared dtypes skip inference and parse sprint names directly as strings
+        df = pd.read_csv(flow_file, engine='c', dtype=FLOW_DATA_DTYPES)
         # Ensure columns exist and normalize string
         if "sprint_name" in df.columns:
-            df["sprint_name"] = df["sprint_name"].astype(str).str.strip()
+            df["sprint_name"] = df["sprint_name"].str.strip()
         return df
     except Exception as e:
         logger.error(f"Error reading flow data: {e}")
@@ -2,10 +2,22 @@
 import os
 import json
 import logging
+from concurrent.futures import Future
+from typing import Optional, Tuple, TYPE_CHECKING
+import numpy as np
 import pandas as pd
-import gspread
-from openpyxl.formatting.rule import ColorScaleRule
-from config import GOOGLE_CREDENTIALS_JSON, GOOGLE_SHEET_URL, SHEET_NAME, JIRA_PROJECT_KEY, FIELD_TEAM_FILTER_VALUE
+from config import (
+    GOOGLE_CREDENTIALS_JSON,
+    GOOGLE_SHEET_URL,
+    GOOGLE_API_KEY,
+    ADMIN_EMAIL,
+    SHEET_NAME,
+    JIRA_PROJECT_KEY,
+    FIELD_TEAM_FILTER_VALUE
+)
+
+if TYPE_CHECKING:
+    import gspread
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +30,7 @@ class SheetsClient:
         self.team_filter = team_filter if team_filter is not None else FIELD_TEAM_FILTER_VALUE
         self.client = self._connect()
     
-    def _connect(self) -> gspread.Client:
+    def _connect(self) -> Optional["gspread.Client"]:
         """Connect to Google Sheets using available credentials.
         
         Returns:
@@ -28,6 +40,8 @@ class SheetsClient:
         if GOOGLE_CREDENTIALS_JSON:
             try:
                 logger.info("Attempting to use Service Account credentials...")
+                # gspread pulls in the Google auth stack, so only import it when used
+                import gspread
                 if GOOGLE_CREDENTIALS_JSON.strip().startswith("{"):
                     # JSON string in environment variable
                     creds_dict = json.loads(GOOGLE_CREDENTIALS_JSON)
@@ -41,8 +55,7 @@ class SheetsClient:
                 logger.error(f"Failed to use Service Account credentials: {e}")
 
         # Method 2: API Key (only works for PUBLIC sheets - read-only)
-        api_key = os.getenv('GOOGLE_API_KEY')
-        if api_key:
+        if GOOGLE_API_KEY:
             try:
                 logger.info("Attempting to use API Key (read-only for public sheets)...")
                 logger.warning("Note: API Keys only work for PUBLIC sheets and read-only access")
@@ -58,178 +71,283 @@ class SheetsClient:
         logger.info(f"Data will be saved to: ../output/Engineering Productivity - {JIRA_PROJECT_KEY} - {self.team_filter}.xlsx and ../output/Raw Data Output - {JIRA_PROJECT_KEY} - {self.team_filter}.csv")
         return None
     
-    def update_sheets(self, raw_df: pd.DataFrame, dashboard_df: pd.DataFrame):
+    def open_worksheets(self) -> Optional[Tuple]:
+        """Open the spreadsheet and its two dashboard tabs, creating any that are missing.
+        
+        Only talks to the Sheets API, so it can run in the background while the
+        dashboard is still being calculated.
+        
+        Returns:
+            Tuple of (spreadsheet, Raw_Data_Log worksheet, Executive_Dashboard worksheet),
+            or None if the client is not connected
+        """
+        if not self.client:
+            return None
+        
+        import gspread
+        
+        # Open Sheet - priority: URL/ID from env var, then by name
+        if GOOGLE_SHEET_URL:
+            logger.info(f"Opening Google Sheet from URL: {GOOGLE_SHEET_URL[:50]}...")
+            try:
+                sh = self.client.open_by_url(GOOGLE_SHEET_URL)
+            except Exception as e:
+                logger.error(f"Failed to open sheet by URL: {e}")
+                # Extract sheet ID from URL and try by key
+                import re
+                match = re.search(r'/d/([a-zA-Z0-9-_]+)', GOOGLE_SHEET_URL)
+                if match:
+                    sheet_id = match.group(1)
+                    logger.info(f"Trying to open by extracted ID: {sheet_id}")
+                    sh = self.client.open_by_key(sheet_id)
+                else:
+                    raise Exception(f"Could not extract sheet ID from URL: {GOOGLE_SHEET_URL}")
+        else:
+            try:
+                sh = self.client.open(SHEET_NAME)
+            except gspread.SpreadsheetNotFound:
+                logger.info(f"Spreadsheet '{SHEET_NAME}' not found. Creating it.")
+                sh = self.client.create(SHEET_NAME)
+                sh.share(ADMIN_EMAIL, perm_type='user', role='writer')
+        
+        # Look up both tabs with a single metadata fetch
+        worksheets = {ws.title: ws for ws in sh.worksheets()}
+        
+        # Tab 1: Raw_Data_Log (receives what was the full executive dashboard)
+        ws_raw = worksheets.get("Raw_Data_Log")
+        if ws_raw is None:
+            ws_raw = sh.add_worksheet(title="Raw_Data_Log", rows=1000, cols=20)
+        
+        # Tab 2: Executive_Dashboard (simplified to 5 columns with renamed headers)
+        ws_dash = worksheets.get("Executive_Dashboard")
+        if ws_dash is None:
+            ws_dash = sh.add_worksheet(title="Executive_Dashboard", rows=100, cols=5)
+        
+        return sh, ws_raw, ws_dash
+    
+    def update_sheets(self, raw_df: pd.DataFrame, dashboard_df: pd.DataFrame, worksheets: Optional[Future] = None):
         """Write dataframes to Google Sheets tabs.
         
         Args:
             raw_df: Raw metrics dataframe
             dashboard_df: Aggregated dashboard dataframe
+            worksheets: Future of an open_worksheets call started earlier (opened here if None)
         """
         if not self.client:
             logger.warning("Google Sheets client is not connected. Saving to local files instead...")
             self._save_local_files(raw_df, dashboard_df)
             return
-
+        
         try:
-            # Open Sheet - priority: URL/ID from env var, then by name
-            if GOOGLE_SHEET_URL:
-                logger.info(f"Opening Google Sheet from URL: {GOOGLE_SHEET_URL[:50]}...")
-                try:
-                    sh = self.client.open_by_url(GOOGLE_SHEET_URL)
-                except Exception as e:
-                    logger.error(f"Failed to open sheet by URL: {e}")
-                    # Extract sheet ID from URL and try by key
-                    import re
-                    match = re.search(r'/d/([a-zA-Z0-9-_]+)', GOOGLE_SHEET_URL)
-                    if match:
-                        sheet_id = match.group(1)
-                        logger.info(f"Trying to open by extracted ID: {sheet_id}")
-                        sh = self.client.open_by_key(sheet_id)
-                    else:
-                        raise Exception(f"Could not extract sheet ID from URL: {GOOGLE_SHEET_URL}")
+            if worksheets is None:
+                sh, ws_raw, ws_dash = self.open_worksheets()
             else:
-                try:
-                    sh = self.client.open(SHEET_NAME)
-                except gspread.SpreadsheetNotFound:
-                    logger.info(f"Spreadsheet '{SHEET_NAME}' not found. Creating it.")
-                    sh = self.client.create(SHEET_NAME)
-                    sh.share(os.getenv("ADMIN_EMAIL", "admin@example.com"), perm_type='user', role='writer')
-            
-            # Update Tab 1: Raw_Data_Log (receives what was the full executive dashboard)
-            try:
-                ws_raw = sh.worksheet("Raw_Data_Log")
-            except gspread.WorksheetNotFound:
-                ws_raw = sh.add_worksheet(title="Raw_Data_Log", rows=1000, cols=20)
-            
-            ws_raw.clear()
-            ws_raw.update([dashboard_df.columns.values.tolist()] + dashboard_df.values.tolist())
-            
-            # Update Tab 2: Executive_Dashboard (simplified to 5 columns with renamed headers)
-            try:
-                ws_dash = sh.worksheet("Executive_Dashboard")
-            except gspread.WorksheetNotFound:
-                ws_dash = sh.add_worksheet(title="Executive_Dashboard", rows=100, cols=5)
+                sh, ws_raw, ws_dash = worksheets.result()
             
             # Create simplified dashboard with renamed columns
             simplified_dash = dashboard_df[[
                 'Sprint Name', 'Velocity Score', 'Quality Score', 'Flow Score', 'FINAL AI IMPACT INDEX'
-            ]].copy()
-            simplified_dash.rename(columns={
+            ]].rename(columns={
                 'Sprint Name': 'Iteration Name',
                 'FINAL AI IMPACT INDEX': 'Overall Score'
-            }, inplace=True)
-            
-            ws_dash.clear()
-            ws_dash.update([simplified_dash.columns.values.tolist()] + simplified_dash.values.tolist())
+            })
             
-            # Apply red text color to cells with asterisks in Flow Score column
-            self._apply_red_asterisk_formatting(sh, ws_dash, dashboard_df)
+            # Clear and rewrite both tabs in one request each
+            sh.values_batch_clear(body={"ranges": [ws_raw.title, ws_dash.title]})
+            sh.values_batch_update(body={
+                "valueInputOption": "RAW",
+                "data": [
+                    {"range": f"{ws_raw.title}!A1", "values": self._sheet_values(dashboard_df)},
+                    {"range": f"{ws_dash.title}!A1", "values": self._sheet_values(simplified_dash)}
+                ]
+            })
             
-            # Apply color scale to Overall Score column (column E, index 5)
-            self._apply_color_scale(sh, ws_dash, simplified_dash)
+            # Apply red text to imputed Flow Scores and the color scale to Overall Score
+            # (column E, index 5) in a single formatting request
+            self._apply_formatting(sh, ws_dash, dashboard_df, simplified_dash)
             
             logger.info("Successfully updated Google Sheets.")
             
         except Exception as e:
             logger.error(f"Failed to update Google Sheets: {e}")
     
-    def _apply_color_scale(self, spreadsheet, worksheet, dataframe):
-        """Apply color scale conditional formatting to Overall Score column.
+    @staticmethod
+    def _sheet_values(dataframe: pd.DataFrame) -> list:
+        """Convert a DataFrame into the header and rows for the Sheets values API.
+        
+        Datetime columns are formatted in one vectorized pass so the payload only
+        holds plain JSON values.
+        
+        Args:
+            dataframe: DataFrame to write
+            
+        Returns:
+            List of rows, header first
+        """
+        datetime_cols = dataframe.select_dtypes(include=['datetime', 'datetimetz']).columns
+        if len(datetime_cols) > 0:
+            dataframe = dataframe.assign(**{
+                col: dataframe[col].dt.strftime('%Y-%m-%d %H:%M:%S').fillna('')
+                for col in datetime_cols
+            })
+        return [dataframe.columns.tolist()] + dataframe.to_numpy(dtype=object).tolist()
+    
+    def _apply_formatting(self, spreadsheet, worksheet, dashboard_df, simplified_dash):
+        """Apply the Executive_Dashboard formatting in one batch_update request.
+        
+        batch_update is atomic, so if the combined request fails each formatting
+        group is retried on its own; one bad group does not block the other.
         
         Args:
             spreadsheet: gspread Spreadsheet object
             worksheet: gspread Worksheet object
-            dataframe: DataFrame to determine data range
+            dashboard_df: DataFrame to determine which rows have imputed flow scores
+            simplified_dash: DataFrame to determine the color scale data range
         """
+        # (requests, success message, failure message) per formatting group
+        groups = []
         try:
-            num_rows = len(dataframe) + 1  # +1 for header
-            
-            # Define color scale: red (low) -> yellow (mid) -> green (high)
-            requests = [{
-                "addConditionalFormatRule": {
-                    "rule": {
-                        "ranges": [{
-                            "sheetId": worksheet.id,
-                            "startRowIndex": 1,  # Start after header
-                            "endRowIndex": num_rows,
-                            "startColumnIndex": 4,  # Column E (Overall Score)
-                            "endColumnIndex": 5
-                        }],
-                        "gradientRule": {
-                            "minpoint": {
-                                "color": {"red": 0.957, "green": 0.427, "blue": 0.427},  # Red
-                                "type": "MIN"
-                            },
-                            "midpoint": {
-                                "color": {"red": 1.0, "green": 0.902, "blue": 0.6},  # Yellow
-                                "type": "PERCENTILE",
-                                "value": "50"
-                            },
-                            "maxpoint": {
-                                "color": {"red": 0.573, "green": 0.816, "blue": 0.518},  # Green
-                                "type": "MAX"
-                            }
-                        }
-                    },
-                    "index": 0
-                }
-            }]
-            
-            spreadsheet.batch_update({"requests": requests})
-            logger.info("Applied color scale to Overall Score column")
-            
+            red_requests = self._red_asterisk_requests(worksheet, dashboard_df)
+            if red_requests:
+                groups.append((
+                    red_requests,
+                    f"Applied red formatting to {len(red_requests)} imputed flow scores",
+                    "Could not apply red asterisk formatting",
+                ))
+        except Exception as e:
+            logger.warning(f"Could not apply red asterisk formatting: {e}")
+        try:
+            groups.append((
+                self._color_scale_requests(worksheet, simplified_dash),
+                "Applied color scale to Overall Score column",
+                "Could not apply color scale",
+            ))
         except Exception as e:
             logger.warning(f"Could not apply color scale: {e}")
+        
+        if len(groups) > 1:
+            try:
+                spreadsheet.batch_update({"requests": [r for requests, _, _ in groups for r in requests]})
+                for _, applied, _ in groups:
+                    logger.info(applied)
+                return
+            except Exception as e:
+                logger.warning(f"Could not apply formatting in one request, retrying separately: {e}")
+        
+        for requests, applied, failed in groups:
+            try:
+                spreadsheet.batch_update({"requests": requests})
+                logger.info(applied)
+            except Exception as e:
+                logger.warning(f"{failed}: {e}")
     
-    def _apply_red_asterisk_formatting(self, spreadsheet, worksheet, dataframe):
-        """Apply red text color to imputed Flow Score cells.
+    @staticmethod
+    def _color_scale_requests(worksheet, dataframe) -> list:
+        """Build the color scale conditional formatting request for Overall Score column.
         
         Args:
-            spreadsheet: gspread Spreadsheet object
             worksheet: gspread Worksheet object
-            dataframe: DataFrame to determine which rows have imputed flow scores
-        """
-        try:
-            # Find rows with imputed flow scores
-            imputed_rows = dataframe[dataframe['Flow Score Imputed'] == True].index.tolist()
-            
-            if not imputed_rows:
-                return
+            dataframe: DataFrame to determine data range
             
-            # Build requests to format cells red
-            requests = []
-            for idx in imputed_rows:
-                row_num = idx + 2  # +2 for header and 0-indexing
-                requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": worksheet.id,
-                            "startRowIndex": row_num - 1,
-                            "endRowIndex": row_num,
-                            "startColumnIndex": 3,  # Column D (Flow Score)
-                            "endColumnIndex": 4
+        Returns:
+            List of batch_update requests
+        """
+        num_rows = len(dataframe) + 1  # +1 for header
+        
+        # Define color scale: red (low) -> yellow (mid) -> green (high)
+        return [{
+            "addConditionalFormatRule": {
+                "rule": {
+                    "ranges": [{
+                        "sheetId": worksheet.id,
+                        "startRowIndex": 1,  # Start after header
+                        "endRowIndex": num_rows,
+                        "startColumnIndex": 4,  # Column E (Overall Score)
+                        "endColumnIndex": 5
+                    }],
+                    "gradientRule": {
+                        "minpoint": {
+                            "color": {"red": 0.957, "green": 0.427, "blue": 0.427},  # Red
+                            "type": "MIN"
                         },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "textFormat": {
-                                    "foregroundColor": {
-                                        "red": 1.0,
-                                        "green": 0.0,
-                                        "blue": 0.0
-                                    }
-                                }
-                            }
+                        "midpoint": {
+                            "color": {"red": 1.0, "green": 0.902, "blue": 0.6},  # Yellow
+                            "type": "PERCENTILE",
+                            "value": "50"
                         },
-                        "fields": "userEnteredFormat.textFormat.foregroundColor"
+                        "maxpoint": {
+                            "color": {"red": 0.573, "green": 0.816, "blue": 0.518},  # Green
+                            "type": "MAX"
+                        }
                     }
-                })
-            
-            if requests:
-                spreadsheet.batch_update({"requests": requests})
-                logger.info(f"Applied red formatting to {len(imputed_rows)} imputed flow scores")
+                },
+                "index": 0
+            }
+        }]
+    
+    @staticmethod
+    def _red_asterisk_requests(worksheet, dataframe) -> list:
+        """Build requests applying red text color to imputed Flow Score cells.
+        
+        Args:
+            worksheet: gspread Worksheet object
+            dataframe: DataFrame to determine which rows have imputed flow scores
             
-        except Exception as e:
-            logger.warning(f"Could not apply red asterisk formatting: {e}")
+        Returns:
+            List of batch_update requests, one per imputed row
+        """
+        # Find rows with imputed flow scores (positions, since the sorted dashboard
+        # keeps its merge index labels)
+        imputed_positions = np.flatnonzero(dataframe['Flow Score Imputed'].to_numpy(dtype=bool))
+        
+        # Build requests to format cells red
+        requests = []
+        for idx in imputed_positions:
+            row_num = int(idx) + 2  # +2 for header and 0-indexing
+            requests.append({
+                "repeatCell": {
+                    "range": {
+                        "sheetId": worksheet.id,
+                        "startRowIndex": row_num - 1,
+                        "endRowIndex": row_num,
+                        "startColumnIndex": 3,  # Column D (Flow Score)
+                        "endColumnIndex": 4
+                    },
+                    "cell": {
+                        "userEnteredFormat": {
+                            "textFormat": {
+                                "foregroundColor": {
+                                    "red": 1.0,
+                                    "green": 0.0,
+                                    "blue": 0.0
+                                }
+                            }
+                        }
+                    },
+                    "fields": "userEnteredFormat.textFormat.foregroundColor"
+                }
+            })
+        return requests
+    
+    @staticmethod
+    def _autosize_columns(worksheet, dataframe: pd.DataFrame):
+        """Fit Excel column widths to the longest header or value of each column.
+        
+        Args:
+            worksheet: openpyxl Worksheet the dataframe was written to
+            dataframe: DataFrame written to the worksheet (header in row 1)
+        """
+        from openpyxl.utils import get_column_letter
+        
+        for col_idx, (name, values) in enumerate(dataframe.items(), start=1):
+            lengths = values.astype(str).str.len()
+            # Missing and zero values are written as blank/falsy cells and don't count
+            blank = values.isna()
+            if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+                blank |= values == 0
+            max_length = max(len(str(name)), int(lengths[~blank].max()) if (~blank).any() else 0)
+            adjusted_width = min(max_length + 2, 50)  # Add padding, cap at 50
+            worksheet.column_dimensions[get_column_letter(col_idx)].width = adjusted_width
     
     def _save_local_files(self, raw_df: pd.DataFrame, dashboard_df: pd.DataFrame):
         """Save dataframes to local files when Google Sheets is unavailable.
@@ -239,21 +357,25 @@ class SheetsClient:
             dashboard_df: Aggregated dashboard dataframe
         """
         try:
+            # openpyxl is only needed for the offline export
+            from openpyxl.formatting.rule import ColorScaleRule
+            from openpyxl.styles import Font
+            
             # Save as Excel file with multiple sheets
             os.makedirs('../output', exist_ok=True)
             output_file = f'../output/Engineering Productivity - {JIRA_PROJECT_KEY} - {self.team_filter}.xlsx'
             
             # Create simplified dashboard with renamed columns
+            # Column selection and rename already return new frames, no explicit copy needed
             simplified_dash = dashboard_df[[
                 'Sprint Name', 'Velocity Score', 'Quality Score', 'Flow Score', 'Flow Score Imputed', 'FINAL AI IMPACT INDEX'
-            ]].copy()
+            ]]
             simplified_dash_display = simplified_dash[[
                 'Sprint Name', 'Velocity Score', 'Quality Score', 'Flow Score', 'FINAL AI IMPACT INDEX'
-            ]].copy()
-            simplified_dash_display.rename(columns={
+            ]].rename(columns={
                 'Sprint Name': 'Iteration Name',
                 'FINAL AI IMPACT INDEX': 'Overall Score'
-            }, inplace=True)
+            })
             
             with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
                 simplified_dash_display.to_excel(writer, sheet_name='Executive_Dashboard', index=False)
@@ -264,11 +386,10 @@ class SheetsClient:
                 worksheet = writer.sheets['Executive_Dashboard']
                 
                 # Apply red color to imputed Flow Score cells
-                from openpyxl.styles import Font
-                for idx in range(len(simplified_dash)):
-                    if simplified_dash.iloc[idx]['Flow Score Imputed']:
-                        cell = worksheet.cell(row=idx + 2, column=4)  # Flow Score is column D, +2 for header and 1-indexing
-                        cell.font = Font(color='FF0000')  # Red color
+                imputed_positions = np.flatnonzero(simplified_dash['Flow Score Imputed'].to_numpy(dtype=bool))
+                for idx in imputed_positions:
+                    cell = worksheet.cell(row=int(idx) + 2, column=4)  # Flow Score is column D, +2 for header and 1-indexing
+                    cell.font = Font(color='FF0000')  # Red color
                 
                 # Column E (Overall Score) - apply to data rows only
                 num_rows = len(simplified_dash_display)
@@ -279,39 +400,25 @@ class SheetsClient:
                 )
                 worksheet.conditional_formatting.add(f'E2:E{num_rows + 1}', color_scale)
                 
-                # Auto-adjust column widths for Executive_Dashboard
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if cell.value:
-                                max_length = max(max_length, len(str(cell.value)))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)  # Add padding, cap at 50
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-                
-                # Auto-adjust column widths for Raw_Data_Log
-                raw_worksheet = writer.sheets['Raw_Data_Log']
-                for column in raw_worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if cell.value:
-                                max_length = max(max_length, len(str(cell.value)))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)  # Add padding, cap at 50
-                    raw_worksheet.column_dimensions[column_letter].width = adjusted_width
+                # Auto-adjust column widths for both sheets
+                self._autosize_columns(worksheet, simplified_dash_display)
+                self._autosize_columns(writer.sheets['Raw_Data_Log'], dashboard_df)
             
             logger.info(f"✓ Saved to Excel file: {output_file}")
             logger.info("  You can manually upload this to Google Sheets")
             
             # Also save raw data as CSV for easy viewing
             csv_file = f'../output/Raw Data Output - {JIRA_PROJECT_KEY} - {self.team_filter}.csv'
-            raw_df.to_csv(csv_file, index=False)
+            raw_export = raw_df
+            if 'Sprint Start Date' in raw_df.columns and raw_df['Sprint Start Date'].isna().any():
+                # Undated sprints used to be datetime.min, which made the column object dtype and
+                # the CSV text include the time; keep that text (0001-01-01 for undated sprints).
+                # With every sprint dated the column was datetime64 before too and is written as is.
+                sprint_start_dates = pd.to_datetime(raw_df['Sprint Start Date'])
+                raw_export = raw_df.assign(**{
+                    'Sprint Start Date': sprint_start_dates.dt.strftime('%Y-%m-%d %H:%M:%S').fillna('0001-01-01 00:00:00')
+                })
+            raw_export.to_csv(csv_file, index=False)
             logger.info(f"✓ Saved raw data to: {csv_file}")
             
         except Exception as e:
@@ -0,0 +1,54 @@
+"""End-to-end tests for the raw metrics -> dashboard pipeline."""
+import datetime
+from types import SimpleNamespace
+
+import pandas as pd
+
+from config import FIELD_SPRINT, FIELD_STORY_POINTS
+from dashboard_calculator import calculate_scores
+from metrics_processor import build_raw_metrics
+
+TEAM = "Foundation"
+NOW_UTC = datetime.datetime(2025, 10, 1, tzinfo=datetime.timezone.utc)
+
+
+def _status_change(created, from_status, to_status):
+    """Build a changelog history holding a single status transition."""
+    item = SimpleNamespace(field='status', fromString=from_status, toString=to_status)
+    return SimpleNamespace(created=created, items=[item])
+
+
+def _make_issue(key, sprint_name, issue_type="Story"):
+    """Build a minimal accepted Jira issue in the given sprint."""
+    fields = SimpleNamespace(
+        status=SimpleNamespace(name="Accepted"),
+        issuetype=SimpleNamespace(name=issue_type),
+        created='2025-09-01T09:00:00.000+0000',
+    )
+    setattr(fields, FIELD_STORY_POINTS, 3)
+    setattr(fields, FIELD_SPRINT, [SimpleNamespace(name=sprint_name, goal=f"{TEAM} goals")])
+    histories = [
+        _status_change('2025-09-02T10:00:00.000+0000', 'To Do', 'Started'),
+        _status_change('2025-09-04T10:00:00.000+0000', 'Started', 'Accepted'),
+    ]
+    return SimpleNamespace(key=key, fields=fields, changelog=SimpleNamespace(histories=histories))
+
+
+def test_scores_when_every_sprint_is_dated():
+    """Categorical sprint names from build_raw_metrics must still map to datetime start dates."""
+    sprints = [
+        "Iteration 09.01.25 - 09.05.25",
+        "Iteration 09.08.25 - 09.12.25",
+        "Iteration 09.15.25 - 09.19.25",
+    ]
+    issues = [
+        _make_issue(f"P-{i}", sprint, issue_type="Bug" if i == 0 else "Story")
+        for i, sprint in enumerate(sprints * 3)
+    ]
+    raw_df = build_raw_metrics(issues, team_filter=TEAM, now_utc=NOW_UTC)
+    
+    dashboard_df = calculate_scores(raw_df, pd.DataFrame(columns=["sprint_name", "flow_score_raw"]))
+    
+    # The most recent (active) sprint is excluded from the dashboard
+    assert list(dashboard_df['Sprint Name']) == sprints[1::-1]
+    assert (dashboard_df['Completed Tickets'] == 3).all()
@@ -0,0 +1,190 @@
+"""Tests for the Jira client's issue cache and changelog fetching."""
+import json
+from unittest import mock
+
+import pytest
+from jira.resources import Issue
+
+import jira_client
+from config import FIELD_SPRINT
+
+TEAM = "Foundation"
+SPRINT = "Iteration 09.01.25 - 09.05.25"
+
+
+class FakeJiraServer:
+    """Serves enhanced_search_issues and changelog/bulkfetch from a dict of issues, recording each request."""
+    
+    def __init__(self):
+        self.goals = {}
+        self.updated = {}
+        self.histories = {}
+        self.searches = []
+        self.bulk_requests = []
+        self.bulk_response = None  # Replaces the generated bulkfetch payload when set
+    
+    def add_issue(self, key, goal, updated, status_changes):
+        self.goals[key] = goal
+        self.updated[key] = updated
+        self.histories[key] = [
+            {"created": created, "items": [{"field": "status", "fromString": from_status, "toString": to_status}]}
+            for created, from_status, to_status in status_changes
+        ]
+    
+    def _raw_issue(self, key, with_changelog):
+        raw = {
+            "id": key.split("-")[1],
+            "key": key,
+            "fields": {
+                "updated": self.updated[key],
+                FIELD_SPRINT: [{"name": SPRINT, "goal": self.goals[key]}],
+            },
+        }
+        if with_changelog:
+            raw["changelog"] = {"histories": list(self.histories[key])}
+        return raw
+    
+    def enhanced_search_issues(self, jql, **kwargs):
+        self.searches.append((jql, kwargs))
+        keys = sorted(self.goals, reverse=True)
+        if jql.startswith("key in ("):
+            requested = jql[len("key in ("):-1].split(", ")
+            keys = [key for key in keys if key in requested]
+        with_changelog = kwargs.get("expand") == "changelog"
+        return [Issue({}, None, raw=self._raw_issue(key, with_changelog)) for key in keys]
+    
+    def bulkfetch(self, url, data):
+        assert url.endswith("/changelog/bulkfetch")
+        body = json.loads(data)
+        self.bulk_requests.append(body)
+        payload = self.bulk_response
+        if payload is None:
+            payload = {"issueChangeLogs": [
+                {"issueId": issue_id, "changeHistories": list(self.histories[f"P-{issue_id}"])}
+                for issue_id in body["issueIdsOrKeys"]
+            ]}
+        return mock.Mock(**{"json.return_value": payload})
+
+
+@pytest.fixture
+def server():
+    return FakeJiraServer()
+
+
+@pytest.fixture
+def client(server, tmp_path):
+    connection = mock.Mock()
+    connection.enhanced_search_issues.side_effect = server.enhanced_search_issues
+    connection._get_url.side_effect = lambda path: f"https://jira.example.com/rest/api/3/{path}"
+    connection._session.post.side_effect = server.bulkfetch
+    with mock.patch.object(jira_client.JiraClient, "_validate_credentials"), \
+            mock.patch.object(jira_client.JiraClient, "_connect", return_value=connection):
+        client = jira_client.JiraClient(team_filter=TEAM)
+    client.cache_file = str(tmp_path / "issues.json")
+    return client
+
+
+def _sprint_goal(issue):
+    return getattr(issue.fields, FIELD_SPRINT)[0].goal
+
+
+def _statuses(issue):
+    return [history.items[0].toString for history in issue.changelog.histories]
+
+
+def test_cached_issue_picks_up_sprint_goal_set_later(server, client):
+    """A sprint goal edit leaves the issue's updated unchanged but must not be missed."""
+    server.add_issue("P-1", "", "2025-09-01T09:00:00.000+0000", [
+        ("2025-09-02T10:00:00.000+0000", "To Do", "Started"),
+    ])
+    first_run = client.fetch_issues()
+    assert [_sprint_goal(issue) for issue in first_run] == [""]
+    
+    server.goals["P-1"] = f"{TEAM} goals"
+    server.searches.clear()
+    server.bulk_requests.clear()
+    second_run = client.fetch_issues()
+    
+    assert [_sprint_goal(issue) for issue in second_run] == [f"{TEAM} goals"]
+    assert _statuses(second_run[0]) == ["Started"]
+    # The changelog of the unchanged issue came from the cache
+    assert all("expand" not in kwargs for _, kwargs in server.searches)
+    assert server.bulk_requests == []
+
+
+def test_updated_issue_refetches_its_changelog(server, client):
+    """Only issues whose updated timestamp changed are fetched with their changelog."""
+    server.add_issue("P-1", f"{TEAM} goals", "2025-09-01T09:00:00.000+0000", [
+        ("2025-09-02T10:00:00.000+0000", "To Do", "Started"),
+    ])
+    server.add_issue("P-2", f"{TEAM} goals", "2025-09-01T09:00:00.000+0000", [])
+    client.fetch_issues()
+    
+    server.updated["P-2"] = "2025-09-03T11:00:00.000+0000"
+    server.histories["P-2"].append(
+        {"created": "2025-09-03T11:00:00.000+0000", "items": [{"field": "status", "fromString": "To Do", "toString": "Started"}]}
+    )
+    server.searches.clear()
+    server.bulk_requests.clear()
+    issues = client.fetch_issues()
+    
+    assert [issue.key for issue in issues] == ["P-2", "P-1"]
+    assert [_statuses(issue) for issue in issues] == [["Started"], ["Started"]]
+    assert [body["issueIdsOrKeys"] for body in server.bulk_requests] == [["2"]]
+
+
+def test_bulk_changelog_attaches_status_histories(server, client):
+    server.add_issue("P-1", f"{TEAM} goals", "2025-09-01T09:00:00.000+0000", [
+        ("2025-09-02T10:00:00.000+0000", "To Do", "Started"),
+        ("2025-09-04T10:00:00.000+0000", "Started", "Completed"),
+    ])
+    issues = client.fetch_issues()
+    
+    assert _statuses(issues[0]) == ["Started", "Completed"]
+    assert [body["fieldIds"] for body in server.bulk_requests] == [["status"]]
+    assert all("expand" not in kwargs for _, kwargs in server.searches)
+    assert client.bulk_changelog
+
+
+def test_bulk_changelog_with_epoch_timestamps_falls_back_to_expand(server, client):
+    """A bulkfetch payload with epoch timestamps, as in Jira's documented example, is not used."""
+    server.add_issue("P-1", f"{TEAM} goals", "2025-09-01T09:00:00.000+0000", [
+        ("2025-09-02T10:00:00.000+0000", "To Do", "Started"),
+    ])
+    server.bulk_response = {
+        "issueChangeLogs": [
+            {
+                "changeHistories": [
+                    {
+                        "author": {
+                            "accountId": "5b10a2844c20165700ede21g",
+                            "active": False,
+                            "displayName": "Mia Krystof",
+                        },
+                        "created": 1492070429,
+                        "id": "10001",
+                        "items": [
+                            {
+                                "field": "status",
+                                "fieldId": "status",
+                                "fieldtype": "jira",
+                                "from": "10000",
+                                "fromString": "To Do",
+                                "to": "10001",
+                                "toString": "Started",
+                            }
+                        ],
+                    }
+                ],
+                "issueId": "1",
+            }
+        ],
+        "nextPageToken": None,
+    }
+    issues = client.fetch_issues()
+    
+    assert _statuses(issues[0]) == ["Started"]
+    assert issues[0].changelog.histories[0].created == "2025-09-02T10:00:00.000+0000"
+    changelog_searches = [jql for jql, kwargs in server.searches if kwargs.get("expand") == "changelog"]
+    assert changelog_searches == ["key in (P-1)"]
+    assert not client.bulk_changelog